@@ -0,0 +1,59 @@
+"""
+Shared helpers for the HPKV RIOC examples.
+"""
+
+import functools
+import os
+
+from hpkv_rioc import RiocClient, RiocConfig, RiocTlsConfig
+
+def missing_cert_files(*paths: str) -> list:
+    """Return the certificate paths that do not exist on disk.
+
+    Scans each containing directory once instead of stat-ing every path
+    individually, so validating the usual cert/key/CA trio costs a single
+    directory listing.
+    """
+    by_dir = {}
+    for path in paths:
+        by_dir.setdefault(os.path.dirname(path) or ".", []).append(path)
+    missing = []
+    for dirname, dir_paths in by_dir.items():
+        try:
+            present = {entry.name for entry in os.scandir(dirname)}
+        except OSError:
+            missing.extend(dir_paths)
+            continue
+        missing.extend(p for p in dir_paths if os.path.basename(p) not in present)
+    return missing
+
+@functools.lru_cache(maxsize=16)
+def make_tls(host: str, ca_path: str, certificate_path: str, key_path: str) -> RiocTlsConfig:
+    """Build a client TLS configuration, memoized by host and cert paths."""
+    return RiocTlsConfig(
+        certificate_path=certificate_path,
+        key_path=key_path,
+        ca_path=ca_path,
+        verify_hostname=host,
+        verify_peer=True,
+    )
+
+# Connected clients keyed by connection identity. Reusing a client within
+# one process avoids repeating the connect (and, under TLS, the full
+# handshake) when example code is invoked more than once.
+_CLIENT_CACHE = {}
+
+def get_client(config: RiocConfig) -> RiocClient:
+    """Get a client for the given configuration, reusing an existing connection."""
+    tls = config.tls
+    key = (
+        config.host,
+        config.port,
+        tls.ca_path if tls else None,
+        tls.certificate_path if tls else None,
+        tls.key_path if tls else None,
+    )
+    client = _CLIENT_CACHE.get(key)
+    if client is None:
+        client = _CLIENT_CACHE[key] = RiocClient(config)
+    return client
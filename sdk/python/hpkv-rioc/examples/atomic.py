@@ -7,18 +7,28 @@ import os
 import argparse
 import time
 
-from hpkv_rioc import RiocClient, RiocConfig, RiocTlsConfig
+from hpkv_rioc import RiocClient, RiocConfig, RiocError
+
+from _common import make_tls
+
+# Environment-driven defaults, read and parsed once at import time
+_HOST = os.getenv("RIOC_HOST", "localhost")
+_PORT = int(os.getenv("RIOC_PORT", "8000"))
+_TIMEOUT = int(os.getenv("RIOC_TIMEOUT", "5000"))
+_CA_PATH = os.getenv("RIOC_CA_PATH", "")
+_CERT_PATH = os.getenv("RIOC_CERT_PATH", "")
+_KEY_PATH = os.getenv("RIOC_KEY_PATH", "")
 
 def parse_args():
     """Parse command-line arguments."""
     parser = argparse.ArgumentParser(description="HPKV RIOC Atomic Operations Example")
-    parser.add_argument("--host", default=os.getenv("RIOC_HOST", "localhost"), help="Server hostname")
-    parser.add_argument("--port", type=int, default=int(os.getenv("RIOC_PORT", "8000")), help="Server port")
-    parser.add_argument("--timeout", type=int, default=int(os.getenv("RIOC_TIMEOUT", "5000")), help="Timeout in ms")
+    parser.add_argument("--host", default=_HOST, help="Server hostname")
+    parser.add_argument("--port", type=int, default=_PORT, help="Server port")
+    parser.add_argument("--timeout", type=int, default=_TIMEOUT, help="Timeout in ms")
     parser.add_argument("--tls", action="store_true", help="Enable TLS")
-    parser.add_argument("--ca-path", default=os.getenv("RIOC_CA_PATH", ""), help="CA certificate path")
-    parser.add_argument("--cert-path", default=os.getenv("RIOC_CERT_PATH", ""), help="Client certificate path")
-    parser.add_argument("--key-path", default=os.getenv("RIOC_KEY_PATH", ""), help="Client key path")
+    parser.add_argument("--ca-path", default=_CA_PATH, help="CA certificate path")
+    parser.add_argument("--cert-path", default=_CERT_PATH, help="Client certificate path")
+    parser.add_argument("--key-path", default=_KEY_PATH, help="Client key path")
     return parser.parse_args()
 
 def main():
@@ -38,13 +48,7 @@ def main():
             print("Error: --key-path is required when --tls is enabled")
             return 1
         
-        tls_config = RiocTlsConfig(
-            ca_path=args.ca_path,
-            certificate_path=args.cert_path,
-            key_path=args.key_path,
-            verify_hostname=args.host,
-            verify_peer=True
-        )
+        tls_config = make_tls(args.host, args.ca_path, args.cert_path, args.key_path)
     
     # Create client config
     config = RiocConfig(
@@ -62,37 +66,40 @@ def main():
     try:
         print("\n--- Atomic Operations Example ---\n")
         
-        # Create counter keys
-        counter1 = "atomic_example_counter1"
-        counter2 = "atomic_example_counter2"
+        # Create counter keys (encode once and reuse the bytes form on
+        # every batch/atomic call instead of re-encoding per call)
+        counter1 = b"atomic_example_counter1"
+        counter2 = b"atomic_example_counter2"
         
-        # Clean up any existing counters
+        # Clean up any existing counters in a single batch submission
         try:
-            client.delete_string(counter1)
-            client.delete_string(counter2)
+            timestamp = RiocClient.get_timestamp()
+            with client.batch() as batch:
+                batch.add_delete(counter1, timestamp)
+                batch.add_delete(counter2, timestamp + 1)
             print("Cleaned up existing counters\n")
-        except:
+        except RiocError:
             # Counters might not exist, that's ok
             pass
         
         # Initialize counter1 with value 10
         print("Initializing counter1 with value 10...")
-        value1 = client.atomic_inc_dec_string(counter1, 10)
+        value1 = client.atomic_inc_dec(counter1, 10)
         print(f"Counter1 value: {value1}\n")
         
         # Increment counter1 by 5
         print("Incrementing counter1 by 5...")
-        value2 = client.atomic_inc_dec_string(counter1, 5)
+        value2 = client.atomic_inc_dec(counter1, 5)
         print(f"Counter1 value: {value2}\n")
         
         # Decrement counter1 by 3
         print("Decrementing counter1 by 3...")
-        value3 = client.atomic_inc_dec_string(counter1, -3)
+        value3 = client.atomic_inc_dec(counter1, -3)
         print(f"Counter1 value: {value3}\n")
         
         # Initialize counter2 with value 20
         print("Initializing counter2 with value 20...")
-        value4 = client.atomic_inc_dec_string(counter2, 20)
+        value4 = client.atomic_inc_dec(counter2, 20)
         print(f"Counter2 value: {value4}\n")
         
         # Use batch operations
@@ -100,9 +107,9 @@ def main():
         batch = client.create_batch()
         
         # Add atomic operations to batch
-        timestamp = client.get_timestamp()
-        batch.add_atomic_inc_dec(counter1.encode(), 8, timestamp)   # Increment counter1 by 8
-        batch.add_atomic_inc_dec(counter2.encode(), -7, timestamp)  # Decrement counter2 by 7
+        timestamp = RiocClient.get_timestamp()
+        batch.add_atomic_inc_dec(counter1, 8, timestamp)   # Increment counter1 by 8
+        batch.add_atomic_inc_dec(counter2, -7, timestamp)  # Decrement counter2 by 7
         
         print("Executing batch...")
         tracker = batch.execute()
@@ -117,16 +124,18 @@ def main():
         
         # Verify values with direct reads
         print("Verifying values with direct reads...")
-        verify1 = client.atomic_inc_dec_string(counter1, 0)
-        verify2 = client.atomic_inc_dec_string(counter2, 0)
+        verify1 = client.atomic_inc_dec(counter1, 0)
+        verify2 = client.atomic_inc_dec(counter2, 0)
         
         print(f"Counter1 direct read: {verify1}")
         print(f"Counter2 direct read: {verify2}\n")
         
         # Clean up
         print("Cleaning up...")
-        client.delete_string(counter1)
-        client.delete_string(counter2)
+        timestamp = RiocClient.get_timestamp()
+        with client.batch() as batch:
+            batch.add_delete(counter1, timestamp)
+            batch.add_delete(counter2, timestamp + 1)
         print("Counters deleted\n")
         
         print("Example completed successfully!")
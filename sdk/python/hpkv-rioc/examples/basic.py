@@ -5,11 +5,12 @@ Basic example of using the HPKV RIOC Python SDK.
 import argparse
 import os
 import time
-from datetime import datetime, UTC
 
-from hpkv_rioc import RiocClient, RiocConfig, RiocTlsConfig
+from hpkv_rioc import RiocClient, RiocConfig
 from hpkv_rioc.exceptions import RiocError
 
+from _common import get_client, make_tls, missing_cert_files
+
 def get_default_cert_paths():
     """Get default certificate paths from the RIOC certs directory."""
     workspace_root = ""
@@ -45,19 +46,12 @@ def main():
     # Create TLS configuration if enabled
     tls_config = None
     if args.tls:
-        # Verify certificate files exist
-        for cert_path in [args.client_cert, args.client_key, args.ca_cert]:
-            if not os.path.exists(cert_path):
-                print(f"Error: Certificate file not found: {cert_path}")
-                return
-
-        tls_config = RiocTlsConfig(
-            certificate_path=args.client_cert,
-            key_path=args.client_key,
-            ca_path=args.ca_cert,
-            verify_hostname=args.host,
-            verify_peer=True
-        )
+        # Verify certificate files exist (one directory scan, not a stat per file)
+        for cert_path in missing_cert_files(args.client_cert, args.client_key, args.ca_cert):
+            print(f"Error: Certificate file not found: {cert_path}")
+            return
+
+        tls_config = make_tls(args.host, args.ca_cert, args.client_cert, args.client_key)
 
     # Create client configuration
     config = RiocConfig(
@@ -74,27 +68,35 @@ def main():
         print(f"  Client key:  {args.client_key}")
         print(f"  CA cert:     {args.ca_cert}")
 
-    start_time = datetime.now(UTC)
+    start_time = time.perf_counter_ns()
 
     try:
         # Create client
-        client = RiocClient(config)
-        connect_time = datetime.now(UTC) - start_time
-        print(f"Connected in {connect_time.total_seconds() * 1000:.2f} ms")
+        client = get_client(config)
+        connect_time_ms = (time.perf_counter_ns() - start_time) / 1e6
+        print(f"Connected in {connect_time_ms:.2f} ms")
 
         # Test data
         key = "test_key"
         initial_value = "initial value"
         updated_value = "updated value"
 
-        # Get initial timestamp
-        timestamp = client.get_timestamp()
+        # Seed a locally incremented timestamp: each step gets a strictly
+        # newer timestamp without sleeping between operations
+        ts_counter = RiocClient.get_timestamp()
+
+        def next_ts():
+            nonlocal ts_counter
+            ts_counter += 1
+            return ts_counter
+
+        timestamp = next_ts()
         print(f"\n1. Inserting record with timestamp {timestamp}")
-        start_time = datetime.now(UTC)
+        start_time = time.perf_counter_ns()
         try:
             client.insert_string(key, initial_value, timestamp)
-            insert_time = datetime.now(UTC) - start_time
-            print(f"Insert successful in {insert_time.total_seconds() * 1000:.2f} ms")
+            insert_time_ms = (time.perf_counter_ns() - start_time) / 1e6
+            print(f"Insert successful in {insert_time_ms:.2f} ms")
         except RiocError as e:
             print(f"Insert failed: {e}")
             if e.code == -3:  # I/O error
@@ -102,74 +104,62 @@ def main():
                 print("Please make sure the server is running and accessible at the specified host and port.")
             return
 
-        # Sleep briefly to ensure timestamp increases
-        time.sleep(0.001)
-
         print("\n2. Getting record")
-        start_time = datetime.now(UTC)
+        start_time = time.perf_counter_ns()
         try:
             value = client.get_string(key)
-            get_time = datetime.now(UTC) - start_time
-            print(f"Get successful in {get_time.total_seconds() * 1000:.2f} ms, value: {value}")
+            get_time_ms = (time.perf_counter_ns() - start_time) / 1e6
+            print(f"Get successful in {get_time_ms:.2f} ms, value: {value}")
         except RiocError as e:
-            get_time = datetime.now(UTC) - start_time
-            print(f"Get failed: {e} (took {get_time.total_seconds() * 1000:.2f} ms)")
+            get_time_ms = (time.perf_counter_ns() - start_time) / 1e6
+            print(f"Get failed: {e} (took {get_time_ms:.2f} ms)")
             return
 
-        # Sleep briefly to ensure timestamp increases
-        time.sleep(0.001)
-
         # Full update
-        timestamp = client.get_timestamp()
+        timestamp = next_ts()
         print(f"\n3. Updating record with timestamp {timestamp}")
-        start_time = datetime.now(UTC)
+        start_time = time.perf_counter_ns()
         try:
             client.insert_string(key, updated_value, timestamp)
-            update_time = datetime.now(UTC) - start_time
-            print(f"Update successful in {update_time.total_seconds() * 1000:.2f} ms")
+            update_time_ms = (time.perf_counter_ns() - start_time) / 1e6
+            print(f"Update successful in {update_time_ms:.2f} ms")
         except RiocError as e:
             print(f"Update failed: {e}")
             return
 
-        # Sleep briefly to ensure timestamp increases
-        time.sleep(0.001)
-
         print("\n4. Getting updated record")
-        start_time = datetime.now(UTC)
+        start_time = time.perf_counter_ns()
         try:
             value = client.get_string(key)
-            get_time = datetime.now(UTC) - start_time
-            print(f"Get successful in {get_time.total_seconds() * 1000:.2f} ms, value: {value}")
+            get_time_ms = (time.perf_counter_ns() - start_time) / 1e6
+            print(f"Get successful in {get_time_ms:.2f} ms, value: {value}")
         except RiocError as e:
-            get_time = datetime.now(UTC) - start_time
-            print(f"Get failed: {e} (took {get_time.total_seconds() * 1000:.2f} ms)")
+            get_time_ms = (time.perf_counter_ns() - start_time) / 1e6
+            print(f"Get failed: {e} (took {get_time_ms:.2f} ms)")
             return
 
-        # Sleep briefly to ensure timestamp increases
-        time.sleep(0.001)
-
         # Test delete
         print("\n5. Deleting record")
-        timestamp = client.get_timestamp()
-        start_time = datetime.now(UTC)
+        timestamp = next_ts()
+        start_time = time.perf_counter_ns()
         try:
             client.delete_string(key, timestamp)
-            delete_time = datetime.now(UTC) - start_time
-            print(f"Delete successful in {delete_time.total_seconds() * 1000:.2f} ms")
+            delete_time_ms = (time.perf_counter_ns() - start_time) / 1e6
+            print(f"Delete successful in {delete_time_ms:.2f} ms")
         except RiocError as e:
             print(f"Delete failed: {e}")
             return
 
         # Test get after delete
         print("\n6. Getting deleted record")
-        start_time = datetime.now(UTC)
+        start_time = time.perf_counter_ns()
         try:
             value = client.get_string(key)
-            get_time = datetime.now(UTC) - start_time
-            print(f"Get unexpectedly succeeded in {get_time.total_seconds() * 1000:.2f} ms")
+            get_time_ms = (time.perf_counter_ns() - start_time) / 1e6
+            print(f"Get unexpectedly succeeded in {get_time_ms:.2f} ms")
         except RiocError as e:
-            get_time = datetime.now(UTC) - start_time
-            print(f"Get after delete correctly returned error in {get_time.total_seconds() * 1000:.2f} ms")
+            get_time_ms = (time.perf_counter_ns() - start_time) / 1e6
+            print(f"Get after delete correctly returned error in {get_time_ms:.2f} ms")
 
         print("\nAll tests completed successfully")
 
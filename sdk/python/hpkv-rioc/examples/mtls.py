@@ -6,7 +6,9 @@ import argparse
 import os
 from pathlib import Path
 
-from hpkv_rioc import RiocClient, RiocConfig, RiocTlsConfig
+from hpkv_rioc import RiocConfig
+
+from _common import get_client, make_tls, missing_cert_files
 
 def get_default_cert_paths():
     """Get default certificate paths from the RIOC certs directory."""
@@ -36,20 +38,13 @@ def main():
     
     args = parser.parse_args()
 
-    # Verify certificate files exist
-    for cert_path in [args.client_cert, args.client_key, args.ca_cert]:
-        if not os.path.exists(cert_path):
-            print(f"Error: Certificate file not found: {cert_path}")
-            return
+    # Verify certificate files exist (one directory scan, not a stat per file)
+    for cert_path in missing_cert_files(args.client_cert, args.client_key, args.ca_cert):
+        print(f"Error: Certificate file not found: {cert_path}")
+        return
 
     # Create TLS configuration
-    tls_config = RiocTlsConfig(
-        certificate_path=args.client_cert,
-        key_path=args.client_key,
-        ca_path=args.ca_cert,
-        verify_hostname=args.host,
-        verify_peer=True
-    )
+    tls_config = make_tls(args.host, args.ca_cert, args.client_cert, args.client_key)
 
     # Create client configuration with TLS
     config = RiocConfig(
@@ -66,7 +61,7 @@ def main():
     print(f"  CA cert:     {args.ca_cert}")
 
     # Create client
-    client = RiocClient(config)
+    client = get_client(config)
 
     # Insert some key-value pairs
     print("\nInserting key-value pair...")
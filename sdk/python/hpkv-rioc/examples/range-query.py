@@ -3,13 +3,21 @@ Example demonstrating range query functionality in the HPKV RIOC Python SDK.
 """
 
 import argparse
+import contextlib
 import os
+import sys
 import time
 from datetime import datetime, UTC
 
-from hpkv_rioc import RiocClient, RiocConfig, RiocTlsConfig, RangeQueryResult
+from hpkv_rioc import RiocClient, RiocConfig
 from hpkv_rioc.exceptions import RiocError
 
+from _common import make_tls, missing_cert_files
+
+# Precompiled result-row template; %-formatting a ready template is cheaper
+# than building an f-string per row in the result loops
+_ROW = "  %s => %s\n"
+
 def get_default_cert_paths():
     """Get default certificate paths from the RIOC certs directory."""
     workspace_root = ""
@@ -45,19 +53,12 @@ def main():
     # Create TLS configuration if enabled
     tls_config = None
     if args.tls:
-        # Verify certificate files exist
-        for cert_path in [args.client_cert, args.client_key, args.ca_cert]:
-            if not os.path.exists(cert_path):
-                print(f"Error: Certificate file not found: {cert_path}")
-                return 1
+        # Verify certificate files exist (one directory scan, not a stat per file)
+        for cert_path in missing_cert_files(args.client_cert, args.client_key, args.ca_cert):
+            print(f"Error: Certificate file not found: {cert_path}")
+            return 1
         
-        tls_config = RiocTlsConfig(
-            certificate_path=args.client_cert,
-            key_path=args.client_key,
-            ca_path=args.ca_cert,
-            verify_hostname=args.host,
-            verify_peer=True
-        )
+        tls_config = make_tls(args.host, args.ca_cert, args.client_cert, args.client_key)
 
     # Create client configuration
     config = RiocConfig(
@@ -85,6 +86,13 @@ def main():
     connect_time = (time.time() - start_time) * 1000
     print(f"Connected in {connect_time:.2f} ms")
 
+    # Register every native resource with one ExitStack so teardown is a
+    # single pass that closes tracker, batch and client in reverse order of
+    # creation instead of scattered close() calls
+    stack = contextlib.ExitStack()
+    stack.callback(print, "\nClient disposed")
+    stack.callback(client.close)
+
     try:
         # Insert some test data
         print("\nInserting test data...")
@@ -102,9 +110,15 @@ def main():
             {"key": "vegetable:potato", "value": "A starchy tuber"}
         ]
         
-        # Insert all items
-        for i, item in enumerate(fruits):
-            client.insert_string(item["key"], item["value"], timestamp + i)
+        # Insert all items in a single batch submission instead of one
+        # round-trip per item
+        with client.batch() as batch:
+            batch.add_insert_many(
+                [item["key"].encode() for item in fruits],
+                [item["value"].encode() for item in fruits],
+                range(timestamp, timestamp + len(fruits)),
+            )
+        for item in fruits:
             print(f"  Inserted: {item['key']}")
         
         # Perform a range query for all fruits
@@ -115,8 +129,8 @@ def main():
         print(f"Range query completed in {query_time:.2f} ms")
         
         print(f"Found {len(results)} results:")
-        for key, value in results:
-            print(f"  {key} => {value}")
+        # Emit all result lines with one write instead of a print per row
+        sys.stdout.writelines(_ROW % pair for pair in results)
         
         # Perform a range query for a subset of fruits
         print("\nPerforming range query for fruits from banana to elderberry...")
@@ -126,12 +140,13 @@ def main():
         print(f"Subset range query completed in {query_time:.2f} ms")
         
         print(f"Found {len(results)} results:")
-        for key, value in results:
-            print(f"  {key} => {value}")
+        # Emit all result lines with one write instead of a print per row
+        sys.stdout.writelines(_ROW % pair for pair in results)
         
         # Demonstrate batch range query
         print("\nPerforming batch range query...")
         batch = client.create_batch()
+        stack.callback(batch.close)
         
         # Add a range query for fruits
         batch.add_range_query(b"fruit:", b"fruit:\xff")
@@ -141,6 +156,7 @@ def main():
         
         start_time = time.time()
         tracker = batch.execute()
+        stack.callback(tracker.close)
         tracker.wait()
         batch_time = (time.time() - start_time) * 1000
         print(f"Batch execution completed in {batch_time:.2f} ms")
@@ -148,30 +164,27 @@ def main():
         # Get results for the first range query (fruits)
         fruit_results = tracker.get_range_query_response(0)
         print(f"\nFruit results ({len(fruit_results)}):")
+        # Write the raw bytes straight to stdout instead of decoding each
+        # key/value pair just to print it
+        sys.stdout.flush()
         for result in fruit_results:
-            key = result.key.decode("utf-8")
-            value = result.value.decode("utf-8")
-            print(f"  {key} => {value}")
+            sys.stdout.buffer.write(b"  " + result.key + b" => " + result.value + b"\n")
+        sys.stdout.buffer.flush()
         
         # Get results for the second range query (vegetables)
         veg_results = tracker.get_range_query_response(1)
         print(f"\nVegetable results ({len(veg_results)}):")
+        sys.stdout.flush()
         for result in veg_results:
-            key = result.key.decode("utf-8")
-            value = result.value.decode("utf-8")
-            print(f"  {key} => {value}")
-        
-        # Clean up resources
-        tracker.close()
-        batch.close()
+            sys.stdout.buffer.write(b"  " + result.key + b" => " + result.value + b"\n")
+        sys.stdout.buffer.flush()
         
     except RiocError as e:
         print(f"Error: {e}")
         return 1
     finally:
-        # Clean up
-        client.close()
-        print("\nClient disposed")
+        # Clean up everything registered above in one pass
+        stack.close()
     
     return 0
 
@@ -2,13 +2,15 @@
 HPKV RIOC Python SDK - High Performance Key-Value Store
 """
 
-from .client import RiocClient, RangeQueryResult
+from .client import RiocClient, RiocClientPool, RiocPipeline, RangeQueryResult
 from .config import RiocConfig, RiocTlsConfig
 from .exceptions import RiocError, RiocTimeoutError, RiocConnectionError
 
 __version__ = "0.1.0"
 __all__ = [
     "RiocClient",
+    "RiocClientPool",
+    "RiocPipeline",
     "RiocConfig",
     "RiocTlsConfig",
     "RiocError",
@@ -3,29 +3,148 @@ RIOC client implementation
 """
 
 import ctypes
+import queue
 import threading
+from collections import deque
 from contextlib import contextmanager
-from typing import Optional, List, Dict, Any, Generator, Tuple
+from typing import Optional, List, Generator, Sequence, Tuple
 
 from .config import RiocConfig, RiocTlsConfig
 from .exceptions import RiocError, create_rioc_error
 from .native import (
-    rioc_native,
+    lib as _lib,
     NativeClientConfig,
     NativeTlsConfig,
     NativeRangeResult,
 )
 
+# Bind the native entry points to module-level names once at import time so
+# hot paths pay a single global lookup per call instead of walking
+# attribute chains on the loaded library
+_rioc_batch_wait = _lib.rioc_batch_wait
+_rioc_batch_get_response_async = _lib.rioc_batch_get_response_async
+_rioc_batch_get_atomic_response_async = _lib.rioc_batch_get_atomic_response_async
+_rioc_batch_get_all_responses = _lib.rioc_batch_get_all_responses
+_rioc_batch_tracker_free = _lib.rioc_batch_tracker_free
+_rioc_batch_add_get = _lib.rioc_batch_add_get
+_rioc_batch_add_insert = _lib.rioc_batch_add_insert
+_rioc_batch_add_insert_many = _lib.rioc_batch_add_insert_many
+_rioc_batch_add_delete = _lib.rioc_batch_add_delete
+_rioc_batch_add_range_query = _lib.rioc_batch_add_range_query
+_rioc_batch_add_atomic_inc_dec = _lib.rioc_batch_add_atomic_inc_dec
+_rioc_batch_execute_async = _lib.rioc_batch_execute_async
+_rioc_batch_reset = _lib.rioc_batch_reset
+_rioc_batch_free = _lib.rioc_batch_free
+_rioc_platform_init = _lib.rioc_platform_init
+_rioc_client_connect_with_config = _lib.rioc_client_connect_with_config
+_rioc_client_disconnect_with_config = _lib.rioc_client_disconnect_with_config
+_rioc_platform_cleanup = _lib.rioc_platform_cleanup
+_rioc_get = _lib.rioc_get
+_rioc_insert = _lib.rioc_insert
+_rioc_delete = _lib.rioc_delete
+_rioc_range_query = _lib.rioc_range_query
+_rioc_free_range_results = _lib.rioc_free_range_results
+_rioc_batch_create = _lib.rioc_batch_create
+_rioc_get_timestamp_ns = _lib.rioc_get_timestamp_ns
+_rioc_atomic_inc_dec = _lib.rioc_atomic_inc_dec
+
+# Per-thread scratch for natives that return a (value_ptr, value_len) pair.
+# The native side overwrites both out-params on every call, so reusing one
+# pair per thread saves two ctypes object allocations per operation. The
+# pointer is a c_void_p: reading .value yields the address as a plain int,
+# which string_at accepts directly, with no typed-pointer bookkeeping.
+_scratch = threading.local()
+
+def _out_params() -> Tuple[ctypes.c_void_p, ctypes.c_size_t]:
+    try:
+        return _scratch.value_ptr, _scratch.value_len
+    except AttributeError:
+        _scratch.value_ptr = ctypes.c_void_p()
+        _scratch.value_len = ctypes.c_size_t()
+        return _scratch.value_ptr, _scratch.value_len
+
+def _value_arg(value) -> Tuple[object, int]:
+    """Adapt a value payload for a native c_char_p parameter without copying.
+
+    bytes passes through untouched. Any other buffer-protocol object
+    (bytearray, memoryview, array, numpy array, ...) is wrapped in a ctypes
+    view over its existing storage, so large payloads cross the FFI boundary
+    zero-copy instead of being coerced to bytes first. Read-only non-bytes
+    buffers cannot be viewed this way and fall back to a single copy.
+    """
+    if type(value) is bytes:
+        return value, len(value)
+    view = memoryview(value)
+    if view.ndim != 1 or view.itemsize != 1:
+        view = view.cast("B")
+    length = view.nbytes
+    try:
+        return (ctypes.c_char * length).from_buffer(view), length
+    except TypeError:
+        return view.tobytes(), length
+
+# Platform init/cleanup are refcounted at module scope: the first client in
+# the process initializes the platform and only the last close tears it down.
+# Without this, closing one pooled client would rip the platform out from
+# under every other live client.
+_plat_lock = threading.Lock()
+_plat_refs = 0
+
+def _plat_acquire() -> None:
+    global _plat_refs
+    with _plat_lock:
+        if _plat_refs == 0:
+            result = _rioc_platform_init()
+            if result != 0:
+                raise RiocError(result, "Failed to initialize platform")
+        _plat_refs += 1
+
+def _plat_release() -> None:
+    global _plat_refs
+    with _plat_lock:
+        if _plat_refs > 0:
+            _plat_refs -= 1
+            if _plat_refs == 0:
+                _rioc_platform_cleanup()
+
 class RangeQueryResult:
     """Represents a key-value pair returned from a range query."""
+    __slots__ = ("key", "value")
+
     def __init__(self, key: bytes, value: bytes):
         self.key = key
         self.value = value
 
+def _unpack_range_results(results_ptr, count: int) -> List[RangeQueryResult]:
+    """Convert a native range-result array into RangeQueryResult objects.
+
+    Shared by the client and batch-tracker range paths. The frequently used
+    names are bound to locals so the per-element loop avoids repeated global
+    and attribute lookups.
+    """
+    string_at = ctypes.string_at
+    make_result = RangeQueryResult
+    # The result count is known up front, so fill a presized list instead of
+    # growing one append (and its periodic realloc) at a time
+    results = [None] * count
+    # Iterate the native array directly instead of indexing the pointer;
+    # pointer __getitem__ re-synthesizes a struct wrapper (with bounds and
+    # offset arithmetic in Python) on every access
+    native_array = ctypes.cast(
+        results_ptr, ctypes.POINTER(NativeRangeResult * count)
+    ).contents
+    for i, native_result in enumerate(native_array):
+        results[i] = make_result(
+            string_at(native_result.key, native_result.key_len),
+            string_at(native_result.value, native_result.value_len),
+        )
+    return results
+
 class RiocBatchTracker:
     """Tracks the execution of a batch operation."""
-    def __init__(self, handle: ctypes.c_void_p):
+    def __init__(self, handle: ctypes.c_void_p, op_count: int = 0):
         self._handle = handle
+        self._op_count = op_count
         self._completed = False
         self._closed = False
 
@@ -36,7 +155,7 @@ class RiocBatchTracker:
         if self._completed:
             return
 
-        result = rioc_native.lib.rioc_batch_wait(self._handle, timeout_ms)
+        result = _rioc_batch_wait(self._handle, timeout_ms)
         if result != 0:
             raise create_rioc_error(result)
         self._completed = True
@@ -48,10 +167,9 @@ class RiocBatchTracker:
         if not self._completed:
             raise RiocError(-1, "Batch operation not completed")
 
-        value_ptr = ctypes.POINTER(ctypes.c_char)()
-        value_len = ctypes.c_size_t()
+        value_ptr, value_len = _out_params()
 
-        result = rioc_native.lib.rioc_batch_get_response_async(
+        result = _rioc_batch_get_response_async(
             self._handle, index, ctypes.byref(value_ptr), ctypes.byref(value_len)
         )
         if result != 0:
@@ -62,6 +180,45 @@ class RiocBatchTracker:
 
         return ctypes.string_at(value_ptr, value_len.value)
 
+    def iter_responses(self) -> Generator[bytes, None, None]:
+        """Iterate over the responses of the batch in submission order.
+
+        Waits for the batch to complete if needed, then yields each response
+        as it is reaped, so callers do not have to index the tracker manually.
+        """
+        self.wait()
+        for i in range(self._op_count):
+            yield self.get_response(i)
+
+    def get_responses(self) -> List[bytes]:
+        """Get every response in one native round-trip.
+
+        Equivalent to ``list(self.iter_responses())``, but all N
+        pointer/length pairs are filled by a single native call instead of
+        one call per index; only the per-response bytes copies remain on the
+        Python side.
+        """
+        if self._closed:
+            raise RiocError(-1, "Batch tracker is closed")
+        self.wait()
+        count = self._op_count
+        if count == 0:
+            return []
+
+        value_ptrs = (ctypes.c_void_p * count)()
+        value_lens = (ctypes.c_size_t * count)()
+        result = _rioc_batch_get_all_responses(
+            self._handle, count, value_ptrs, value_lens
+        )
+        if result != 0:
+            raise create_rioc_error(result)
+
+        string_at = ctypes.string_at
+        return [
+            string_at(value_ptrs[i], value_lens[i]) if value_lens[i] else b""
+            for i in range(count)
+        ]
+
     def get_range_query_response(self, index: int) -> List[RangeQueryResult]:
         """Get the response for a RANGE QUERY operation at the specified index."""
         if self._closed:
@@ -69,10 +226,9 @@ class RiocBatchTracker:
         if not self._completed:
             raise RiocError(-1, "Batch operation not completed")
 
-        value_ptr = ctypes.POINTER(ctypes.c_char)()
-        value_len = ctypes.c_size_t()
+        value_ptr, value_len = _out_params()
 
-        result = rioc_native.lib.rioc_batch_get_response_async(
+        result = _rioc_batch_get_response_async(
             self._handle, index, ctypes.byref(value_ptr), ctypes.byref(value_len)
         )
         if result != 0:
@@ -84,17 +240,7 @@ class RiocBatchTracker:
         # For range query, value_ptr points to an array of NativeRangeResult structs
         # and value_len is the count of results
         results_ptr = ctypes.cast(value_ptr, ctypes.POINTER(NativeRangeResult))
-        results_count = value_len.value
-
-        # Convert native results to Python objects
-        results = []
-        for i in range(results_count):
-            result = results_ptr[i]
-            key = ctypes.string_at(result.key, result.key_len)
-            value = ctypes.string_at(result.value, result.value_len)
-            results.append(RangeQueryResult(key, value))
-
-        return results
+        return _unpack_range_results(results_ptr, value_len.value)
 
     def get_atomic_result(self, index: int) -> int:
         """Get the response for an ATOMIC_INC_DEC operation at the specified index."""
@@ -103,21 +249,16 @@ class RiocBatchTracker:
         if not self._completed:
             raise RiocError(-1, "Batch operation not completed")
 
-        value_ptr = ctypes.POINTER(ctypes.c_char)()
-        value_len = ctypes.c_size_t()
-
-        result = rioc_native.lib.rioc_batch_get_response_async(
-            self._handle, index, ctypes.byref(value_ptr), ctypes.byref(value_len)
+        # The native shim writes the counter straight into an int64 out-param,
+        # so there is no pointer/length pair to cast and dereference here
+        result_value = ctypes.c_int64()
+        result = _rioc_batch_get_atomic_response_async(
+            self._handle, index, ctypes.byref(result_value)
         )
         if result != 0:
             raise create_rioc_error(result)
 
-        if not value_ptr or value_len.value < ctypes.sizeof(ctypes.c_int64):
-            return 0
-
-        # For atomic operations, value_ptr points to an int64_t
-        result_value = ctypes.cast(value_ptr, ctypes.POINTER(ctypes.c_int64))[0]
-        return result_value
+        return result_value.value
 
     def close(self) -> None:
         """Clean up the native resources."""
@@ -129,64 +270,134 @@ class RiocBatchTracker:
                         self.wait(timeout_ms=100)
                     except:  # pylint: disable=bare-except
                         pass
-                rioc_native.lib.rioc_batch_tracker_free(self._handle)
+                _rioc_batch_tracker_free(self._handle)
             finally:
                 self._handle = None
                 self._closed = True
 
-    def __del__(self):
-        """Clean up the native resources."""
-        try:
-            self.close()
-        except:  # pylint: disable=bare-except
-            pass
+    def __enter__(self) -> "RiocBatchTracker":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
 
 class RiocBatch:
     """A batch of RIOC operations."""
     def __init__(self, handle: ctypes.c_void_p):
         self._handle = handle
-        self._operations: List[Dict[str, Any]] = []
+        self._op_count = 0
         self._closed = False
+        self._auto_ts = None
+
+    def _next_timestamp(self) -> int:
+        """Return the next auto-fill timestamp for this batch.
+
+        The clock is read once per batch and advanced by one per operation,
+        so building an N-op batch with omitted timestamps costs one native
+        clock call instead of N while keeping the timestamps distinct and
+        ordered. reset() rearms the clock read.
+        """
+        if self._auto_ts is None:
+            self._auto_ts = _rioc_get_timestamp_ns()
+        else:
+            self._auto_ts += 1
+        return self._auto_ts
 
     def add_get(self, key: bytes) -> None:
         """Add a GET operation to the batch."""
         if self._closed:
             raise RiocError(-1, "Batch is closed")
-        result = rioc_native.lib.rioc_batch_add_get(
+        result = _rioc_batch_add_get(
             self._handle,
             key,
             len(key)
         )
         if result != 0:
             raise create_rioc_error(result)
-        self._operations.append({"type": "get", "key": key})
+        self._op_count += 1
 
-    def add_insert(self, key: bytes, value: bytes, timestamp: int) -> None:
-        """Add an INSERT operation to the batch."""
+    def add_insert(self, key: bytes, value: bytes, timestamp: Optional[int] = None) -> None:
+        """Add an INSERT operation to the batch.
+
+        ``value`` may be any bytes-like object; non-bytes buffers are passed
+        zero-copy (the native side copies into the batch before returning).
+        If ``timestamp`` is omitted, one is drawn from the per-batch clock
+        (read once per batch, incremented per operation).
+        """
         if self._closed:
             raise RiocError(-1, "Batch is closed")
-        result = rioc_native.lib.rioc_batch_add_insert(
+        if timestamp is None:
+            timestamp = self._next_timestamp()
+        value, value_len = _value_arg(value)
+        result = _rioc_batch_add_insert(
             self._handle,
             key,
             len(key),
             value,
-            len(value),
+            value_len,
             timestamp
         )
         if result != 0:
             raise create_rioc_error(result)
-        self._operations.append({
-            "type": "insert",
-            "key": key,
-            "value": value,
-            "timestamp": timestamp
-        })
-
-    def add_delete(self, key: bytes, timestamp: int) -> None:
-        """Add a DELETE operation to the batch."""
+        self._op_count += 1
+
+    def add_insert_many(
+        self,
+        keys: Sequence[bytes],
+        values: Sequence[bytes],
+        timestamps: Sequence[int],
+    ) -> None:
+        """Add INSERT operations for parallel sequences of keys, values and timestamps.
+
+        Equivalent to calling :meth:`add_insert` once per element, but the
+        whole run is packed into ctypes arrays and handed to the native
+        library in a single call, so building a large batch costs one FFI
+        crossing instead of one per operation. The native side validates all
+        elements before adding any, so a failure leaves the batch unchanged.
+        """
         if self._closed:
             raise RiocError(-1, "Batch is closed")
-        result = rioc_native.lib.rioc_batch_add_delete(
+        count = len(keys)
+        if not (count == len(values) == len(timestamps)):
+            raise ValueError("keys, values and timestamps must have the same length")
+        if count == 0:
+            return
+        # Preallocate the arrays and fill by slice assignment: bulk-storing a
+        # sequence is measurably faster than the (type * n)(*seq) constructor,
+        # which unpacks every element through a call argument tuple
+        key_arr = (ctypes.c_char_p * count)()
+        key_arr[:] = keys
+        key_lens = (ctypes.c_size_t * count)()
+        key_lens[:] = [len(key) for key in keys]
+        value_arr = (ctypes.c_char_p * count)()
+        value_arr[:] = values
+        value_lens = (ctypes.c_size_t * count)()
+        value_lens[:] = [len(value) for value in values]
+        ts_arr = (ctypes.c_uint64 * count)()
+        ts_arr[:] = timestamps
+        result = _rioc_batch_add_insert_many(
+            self._handle,
+            key_arr,
+            key_lens,
+            value_arr,
+            value_lens,
+            ts_arr,
+            count,
+        )
+        if result != 0:
+            raise create_rioc_error(result)
+        self._op_count += count
+
+    def add_delete(self, key: bytes, timestamp: Optional[int] = None) -> None:
+        """Add a DELETE operation to the batch.
+
+        If ``timestamp`` is omitted, one is drawn from the per-batch clock.
+        """
+        if self._closed:
+            raise RiocError(-1, "Batch is closed")
+        if timestamp is None:
+            timestamp = self._next_timestamp()
+        result = _rioc_batch_add_delete(
             self._handle,
             key,
             len(key),
@@ -194,11 +405,7 @@ class RiocBatch:
         )
         if result != 0:
             raise create_rioc_error(result)
-        self._operations.append({
-            "type": "delete",
-            "key": key,
-            "timestamp": timestamp
-        })
+        self._op_count += 1
 
     def add_range_query(self, start_key: bytes, end_key: bytes) -> None:
         """Add a range query operation to the batch."""
@@ -212,7 +419,7 @@ class RiocBatch:
             raise TypeError("end_key must be bytes")
         
         # Call native method
-        result = rioc_native.lib.rioc_batch_add_range_query(
+        result = _rioc_batch_add_range_query(
             self._handle,
             start_key, len(start_key),
             end_key, len(end_key)
@@ -220,19 +427,16 @@ class RiocBatch:
         
         if result != 0:
             raise create_rioc_error(result)
-        self._operations.append({
-            "type": "range_query",
-            "start_key": start_key,
-            "end_key": end_key
-        })
+        self._op_count += 1
 
-    def add_atomic_inc_dec(self, key: bytes, value: int, timestamp: int) -> None:
+    def add_atomic_inc_dec(self, key: bytes, value: int, timestamp: Optional[int] = None) -> None:
         """Add an atomic increment/decrement operation to the batch.
 
         Args:
             key: The key of the counter.
             value: The amount to increment (positive) or decrement (negative).
-            timestamp: The timestamp for this operation.
+            timestamp: The timestamp for this operation. If omitted, one
+                is drawn from the per-batch clock.
         """
         if self._closed:
             raise RiocError(-1, "Batch is closed")
@@ -242,11 +446,13 @@ class RiocBatch:
             raise TypeError("key must be bytes")
         if not isinstance(value, int):
             raise TypeError("value must be int")
-        if not isinstance(timestamp, int):
+        if timestamp is None:
+            timestamp = self._next_timestamp()
+        elif not isinstance(timestamp, int):
             raise TypeError("timestamp must be int")
 
         # Call native method
-        result = rioc_native.lib.rioc_batch_add_atomic_inc_dec(
+        result = _rioc_batch_add_atomic_inc_dec(
             self._handle,
             key, len(key),
             value,
@@ -255,212 +461,349 @@ class RiocBatch:
 
         if result != 0:
             raise create_rioc_error(result)
-        self._operations.append({
-            "type": "atomic_inc_dec",
-            "key": key,
-            "value": value,
-            "timestamp": timestamp
-        })
+        self._op_count += 1
 
     def execute(self) -> RiocBatchTracker:
         """Execute the batch operations."""
         if self._closed:
             raise RiocError(-1, "Batch is closed")
-        tracker_handle = rioc_native.lib.rioc_batch_execute_async(self._handle)
+        tracker_handle = _rioc_batch_execute_async(self._handle)
         if not tracker_handle:
             raise RiocError(-1, "Failed to execute batch")
-        return RiocBatchTracker(tracker_handle)
+        return RiocBatchTracker(tracker_handle, self._op_count)
+
+    def reset(self) -> None:
+        """Clear the batch so it can be refilled without reallocating.
+
+        Keeps the native operation slots and value buffer, so reusing one
+        batch across phases avoids an allocation per phase. Any tracker from
+        a previous execute() must be closed before the batch is reset.
+        """
+        if self._closed:
+            raise RiocError(-1, "Batch is closed")
+        _rioc_batch_reset(self._handle)
+        self._op_count = 0
+        self._auto_ts = None
 
     def close(self) -> None:
         """Clean up the native resources."""
         if not self._closed and hasattr(self, "_handle") and self._handle:
             try:
-                rioc_native.lib.rioc_batch_free(self._handle)
+                _rioc_batch_free(self._handle)
             finally:
                 self._handle = None
                 self._closed = True
 
-    def __del__(self):
-        """Clean up the native resources."""
-        try:
-            self.close()
-        except:  # pylint: disable=bare-except
-            pass
+    def __enter__(self) -> "RiocBatch":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+class RiocPipeline:
+    """Keeps up to ``depth`` executed batches in flight at once.
+
+    Batch execution is already asynchronous at the native layer; this object
+    adds bounded pipelining on top, so while one batch crosses the network
+    the caller can build and submit the next. When the pipeline is full,
+    submitting reaps the oldest tracker first, which bounds memory and
+    applies natural backpressure. Use as a context manager (or call
+    ``flush()``) to drain everything still in flight.
+    """
+    def __init__(self, depth: int = 4):
+        if depth < 1:
+            raise ValueError("depth must be at least 1")
+        self._depth = depth
+        self._trackers: deque = deque()
+
+    def submit(self, batch: RiocBatch) -> RiocBatchTracker:
+        """Execute the batch asynchronously, reaping the oldest if full."""
+        if len(self._trackers) >= self._depth:
+            oldest = self._trackers.popleft()
+            oldest.wait()
+            oldest.close()
+        tracker = batch.execute()
+        self._trackers.append(tracker)
+        return tracker
+
+    def flush(self) -> None:
+        """Wait for and close every tracker still in flight."""
+        trackers = self._trackers
+        while trackers:
+            tracker = trackers.popleft()
+            tracker.wait()
+            tracker.close()
+
+    def __enter__(self) -> "RiocPipeline":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.flush()
+
+# Native config structs are cached by value: pools, per-test fixtures and
+# benchmark loops connect many clients from the same RiocConfig, and rebuilding
+# the structs re-encodes every string each time. The struct keeps its encoded
+# bytes alive (ctypes stores them alongside the c_char_p fields), and connect
+# only reads the struct, so sharing one instance across connects is safe.
+_config_cache = {}
+
+def _native_config(config: RiocConfig) -> NativeClientConfig:
+    """Return the (cached) native config struct for a RiocConfig."""
+    tls = config.tls
+    key = (
+        config.host, config.port, config.timeout_ms,
+        None if tls is None else (
+            tls.certificate_path, tls.key_path, tls.ca_path,
+            tls.verify_hostname, tls.verify_peer,
+        ),
+    )
+    native_config = _config_cache.get(key)
+    if native_config is not None:
+        return native_config
+
+    native_config = NativeClientConfig()
+    native_config.host = config.host.encode("utf-8")
+    native_config.port = config.port
+    native_config.timeout_ms = config.timeout_ms
+
+    if tls:
+        native_tls_config = NativeTlsConfig()
+        if tls.certificate_path:
+            native_tls_config.cert_path = tls.certificate_path.encode("utf-8")
+        if tls.key_path:
+            native_tls_config.key_path = tls.key_path.encode("utf-8")
+        if tls.ca_path:
+            native_tls_config.ca_path = tls.ca_path.encode("utf-8")
+        if tls.verify_hostname:
+            native_tls_config.verify_hostname = tls.verify_hostname.encode("utf-8")
+        native_tls_config.verify_peer = tls.verify_peer
+        native_config.tls = ctypes.pointer(native_tls_config)
+    else:
+        native_config.tls = None
+
+    _config_cache[key] = native_config
+    return native_config
 
 class RiocClient:
-    """RIOC client for interacting with the HPKV store."""
+    """RIOC client for interacting with the HPKV store.
+
+    Data-path methods do not take a lock, so independent clients can issue
+    requests from different threads fully in parallel. A single client
+    instance must not be used by multiple threads concurrently; give each
+    thread its own client or serialize access externally.
+    """
     def __init__(self, config: RiocConfig):
         """Initialize the RIOC client."""
-        # Initialize platform
-        result = rioc_native.lib.rioc_platform_init()
-        if result != 0:
-            raise RiocError(result, "Failed to initialize platform")
-
-        # Convert config to native config
-        native_config = NativeClientConfig()
-        native_config.host = config.host.encode("utf-8")
-        native_config.port = config.port
-        native_config.timeout_ms = config.timeout_ms
-
-        # Handle TLS config
-        native_tls_config = None
-        if config.tls:
-            native_tls_config = NativeTlsConfig()
-            if config.tls.certificate_path:
-                native_tls_config.cert_path = config.tls.certificate_path.encode("utf-8")
-            if config.tls.key_path:
-                native_tls_config.key_path = config.tls.key_path.encode("utf-8")
-            if config.tls.ca_path:
-                native_tls_config.ca_path = config.tls.ca_path.encode("utf-8")
-            if config.tls.verify_hostname:
-                native_tls_config.verify_hostname = config.tls.verify_hostname.encode("utf-8")
-            native_tls_config.verify_peer = config.tls.verify_peer
-            self._tls_config = native_tls_config  # Keep reference to prevent GC
-            native_config.tls = ctypes.pointer(native_tls_config)
-        else:
-            native_config.tls = None
-            self._tls_config = None
+        # Initialize platform (refcounted; a no-op after the first client)
+        _plat_acquire()
+
+        native_config = _native_config(config)
 
         # Connect to server
         client_handle = ctypes.c_void_p()
-        result = rioc_native.lib.rioc_client_connect_with_config(
+        result = _rioc_client_connect_with_config(
             ctypes.byref(native_config),
             ctypes.byref(client_handle)
         )
         if result != 0:
+            _plat_release()
             raise create_rioc_error(result)
 
         self._handle = client_handle
         self._closed = False
-        self._lock = threading.RLock()
+        # Only close() needs mutual exclusion; the data paths run unlocked so
+        # independent clients in different threads never serialize on Python
+        # locks. A single client instance must not be shared by concurrent
+        # callers -- use one client per thread (or lock externally).
+        self._close_lock = threading.Lock()
 
     def get(self, key: bytes) -> bytes:
         """Get a value by key."""
         if self._closed:
             raise RiocError(-1, "Client is closed")
 
-        with self._lock:
-            value_ptr = ctypes.POINTER(ctypes.c_char)()
-            value_len = ctypes.c_size_t()
-
-            result = rioc_native.lib.rioc_get(
-                self._handle,
-                key,
-                len(key),
-                ctypes.byref(value_ptr),
-                ctypes.byref(value_len)
-            )
-            if result != 0:
-                raise create_rioc_error(result)
+        value_ptr, value_len = _out_params()
 
-            if not value_ptr or value_len.value == 0:
-                return b""
+        result = _rioc_get(
+            self._handle,
+            key,
+            len(key),
+            ctypes.byref(value_ptr),
+            ctypes.byref(value_len)
+        )
+        if result != 0:
+            raise create_rioc_error(result)
 
-            return ctypes.string_at(value_ptr, value_len.value)
+        if not value_ptr or value_len.value == 0:
+            return b""
+
+        return ctypes.string_at(value_ptr, value_len.value)
 
     def get_string(self, key: str) -> str:
         """Get a string value by string key."""
-        value = self.get(key.encode("utf-8"))
-        return value.decode("utf-8")
+        # encode()/decode() default to UTF-8; the no-argument form skips the
+        # codec-name lookup on every call
+        value = self.get(key.encode())
+        return value.decode()
 
     def insert(self, key: bytes, value: bytes, timestamp: Optional[int] = None) -> None:
-        """Insert or update a key-value pair."""
+        """Insert or update a key-value pair.
+
+        ``value`` may be any bytes-like object; non-bytes buffers are passed
+        zero-copy (the native side copies onto the wire before returning).
+        """
         if self._closed:
             raise RiocError(-1, "Client is closed")
 
-        # Use current timestamp if not provided
+        # Use current timestamp if not provided (direct native call; skips the
+        # staticmethod lookup while keeping the server's clock domain)
         if timestamp is None:
-            timestamp = self.get_timestamp()
-
-        with self._lock:
-            result = rioc_native.lib.rioc_insert(
-                self._handle,
-                key,
-                len(key),
-                value,
-                len(value),
-                timestamp
-            )
-            if result != 0:
-                raise create_rioc_error(result)
+            timestamp = _rioc_get_timestamp_ns()
+
+        value, value_len = _value_arg(value)
+        result = _rioc_insert(
+            self._handle,
+            key,
+            len(key),
+            value,
+            value_len,
+            timestamp
+        )
+        if result != 0:
+            raise create_rioc_error(result)
 
     def insert_string(self, key: str, value: str, timestamp: Optional[int] = None) -> None:
         """Insert or update a string key-value pair."""
-        self.insert(key.encode("utf-8"), value.encode("utf-8"), timestamp)
+        self.insert(key.encode(), value.encode(), timestamp)
 
     def delete(self, key: bytes, timestamp: Optional[int] = None) -> None:
         """Delete a key-value pair."""
         if self._closed:
             raise RiocError(-1, "Client is closed")
 
-        # Use current timestamp if not provided
+        # Use current timestamp if not provided (direct native call; skips the
+        # staticmethod lookup while keeping the server's clock domain)
         if timestamp is None:
-            timestamp = self.get_timestamp()
-
-        with self._lock:
-            result = rioc_native.lib.rioc_delete(
-                self._handle,
-                key,
-                len(key),
-                timestamp
-            )
-            if result != 0:
-                raise create_rioc_error(result)
+            timestamp = _rioc_get_timestamp_ns()
+
+        result = _rioc_delete(
+            self._handle,
+            key,
+            len(key),
+            timestamp
+        )
+        if result != 0:
+            raise create_rioc_error(result)
 
     def delete_string(self, key: str, timestamp: Optional[int] = None) -> None:
         """Delete a key-value pair using string key."""
-        return self.delete(key.encode("utf-8"), timestamp)
+        return self.delete(key.encode(), timestamp)
 
     def range_query(self, start_key: bytes, end_key: bytes) -> List[RangeQueryResult]:
         """Perform a range query to retrieve all key-value pairs within the specified range."""
         if self._closed:
             raise RiocError(-1, "Client is closed")
 
-        with self._lock:
-            results_ptr = ctypes.POINTER(NativeRangeResult)()
-            results_count = ctypes.c_size_t()
-
-            result = rioc_native.lib.rioc_range_query(
-                self._handle,
-                start_key,
-                len(start_key),
-                end_key,
-                len(end_key),
-                ctypes.byref(results_ptr),
-                ctypes.byref(results_count)
-            )
-            if result != 0:
-                raise create_rioc_error(result)
+        results_ptr = ctypes.POINTER(NativeRangeResult)()
+        results_count = ctypes.c_size_t()
 
-            # Convert native results to Python objects
-            results = []
-            if results_ptr and results_count.value > 0:
-                for i in range(results_count.value):
-                    native_result = results_ptr[i]
-                    key = ctypes.string_at(native_result.key, native_result.key_len)
-                    value = ctypes.string_at(native_result.value, native_result.value_len)
-                    results.append(RangeQueryResult(key, value))
+        result = _rioc_range_query(
+            self._handle,
+            start_key,
+            len(start_key),
+            end_key,
+            len(end_key),
+            ctypes.byref(results_ptr),
+            ctypes.byref(results_count)
+        )
+        if result != 0:
+            raise create_rioc_error(result)
 
-                # Free native results
-                rioc_native.lib.rioc_free_range_results(results_ptr, results_count.value)
+        # Convert native results to Python objects
+        results = []
+        if results_ptr and results_count.value > 0:
+            results = _unpack_range_results(results_ptr, results_count.value)
 
-            return results
+            # Free native results
+            _rioc_free_range_results(results_ptr, results_count.value)
+
+        return results
 
     def range_query_string(self, start_key: str, end_key: str) -> List[Tuple[str, str]]:
         """Perform a range query with string keys and return string results."""
-        results = self.range_query(start_key.encode("utf-8"), end_key.encode("utf-8"))
-        return [(result.key.decode("utf-8"), result.value.decode("utf-8")) for result in results]
+        results = self.range_query(start_key.encode(), end_key.encode())
+        return [(result.key.decode(), result.value.decode()) for result in results]
+
+    def get_many(self, keys: Sequence[bytes]) -> List[bytes]:
+        """Get the values for several keys in a single batch round-trip.
+
+        Returns the values in the same order as ``keys``; missing keys
+        surface as errors from the underlying batch, exactly as with
+        individual :meth:`get` calls.
+        """
+        batch = self.create_batch()
+        try:
+            for key in keys:
+                batch.add_get(key)
+            tracker = batch.execute()
+            try:
+                return list(tracker.iter_responses())
+            finally:
+                tracker.close()
+        finally:
+            batch.close()
+
+    def insert_many(
+        self,
+        keys: Sequence[bytes],
+        values: Sequence[bytes],
+        timestamps: Optional[Sequence[int]] = None,
+    ) -> None:
+        """Insert several key-value pairs in a single batch round-trip.
+
+        If ``timestamps`` is omitted, consecutive timestamps are derived from
+        one native clock read.
+        """
+        if timestamps is None:
+            ts = _rioc_get_timestamp_ns()
+            timestamps = range(ts, ts + len(keys))
+        batch = self.create_batch()
+        try:
+            batch.add_insert_many(keys, values, timestamps)
+            tracker = batch.execute()
+            try:
+                tracker.wait()
+            finally:
+                tracker.close()
+        finally:
+            batch.close()
+
+    def delete_many(self, keys: Sequence[bytes], timestamps: Optional[Sequence[int]] = None) -> None:
+        """Delete several keys in a single batch round-trip."""
+        if timestamps is None:
+            ts = _rioc_get_timestamp_ns()
+            timestamps = range(ts, ts + len(keys))
+        batch = self.create_batch()
+        try:
+            for key, timestamp in zip(keys, timestamps):
+                batch.add_delete(key, timestamp)
+            tracker = batch.execute()
+            try:
+                tracker.wait()
+            finally:
+                tracker.close()
+        finally:
+            batch.close()
 
     def create_batch(self) -> RiocBatch:
         """Create a new batch operation."""
         if self._closed:
             raise RiocError(-1, "Client is closed")
 
-        with self._lock:
-            batch_handle = rioc_native.lib.rioc_batch_create(self._handle)
-            if not batch_handle:
-                raise RiocError(-1, "Failed to create batch")
-            return RiocBatch(batch_handle)
+        batch_handle = _rioc_batch_create(self._handle)
+        if not batch_handle:
+            raise RiocError(-1, "Failed to create batch")
+        return RiocBatch(batch_handle)
 
     @contextmanager
     def batch(self) -> Generator[RiocBatch, None, None]:
@@ -474,33 +817,39 @@ class RiocClient:
         finally:
             batch.close()
 
-    @staticmethod
-    def get_timestamp() -> int:
-        """Get the current timestamp in nanoseconds."""
-        return rioc_native.lib.rioc_get_timestamp_ns()
+    def pipeline(self, depth: int = 4) -> RiocPipeline:
+        """Create a pipeline that keeps up to ``depth`` batches in flight."""
+        if self._closed:
+            raise RiocError(-1, "Client is closed")
+        return RiocPipeline(depth)
+
+    # Get the current timestamp in nanoseconds. Bound straight to the native
+    # function: callers invoke the foreign call itself with no Python frame
+    # in between, which matters when a timestamp is drawn per operation in a
+    # tight loop.
+    get_timestamp = staticmethod(_rioc_get_timestamp_ns)
 
     def close(self) -> None:
         """Close the client and release resources."""
         if not self._closed:
-            with self._lock:
+            with self._close_lock:
                 if not self._closed and hasattr(self, "_handle") and self._handle:
                     try:
-                        rioc_native.lib.rioc_client_disconnect_with_config(self._handle)
+                        _rioc_client_disconnect_with_config(self._handle)
                     finally:
                         self._handle = None
                         self._closed = True
-                        # Clean up platform
+                        # Clean up platform (only when the last client closes)
                         try:
-                            rioc_native.lib.rioc_platform_cleanup()
+                            _plat_release()
                         except:  # pylint: disable=bare-except
                             pass
 
-    def __del__(self):
-        """Clean up the native resources."""
-        try:
-            self.close()
-        except:  # pylint: disable=bare-except
-            pass
+    def __enter__(self) -> "RiocClient":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
 
     def atomic_inc_dec(self, key: bytes, value: int, timestamp: Optional[int] = None) -> int:
         """Atomically increment or decrement a counter value.
@@ -519,10 +868,10 @@ class RiocClient:
             raise TypeError("value must be an integer")
 
         if timestamp is None:
-            timestamp = self.get_timestamp()
+            timestamp = _rioc_get_timestamp_ns()
 
         result_value = ctypes.c_int64()
-        result = rioc_native.lib.rioc_atomic_inc_dec(
+        result = _rioc_atomic_inc_dec(
             self._handle,
             key, len(key),
             value,
@@ -546,4 +895,49 @@ class RiocClient:
         Returns:
             The new value of the counter after the operation.
         """
-        return self.atomic_inc_dec(key.encode("utf-8"), value, timestamp) 
\ No newline at end of file
+        return self.atomic_inc_dec(key.encode(), value, timestamp) 
+
+class RiocClientPool:
+    """A fixed-size pool of connected clients shared between threads.
+
+    Connecting a client is the expensive part (platform init plus, under
+    TLS, a full handshake), so worker threads borrow an already-connected
+    client instead of building their own. Each client is used by one
+    borrower at a time, which satisfies the one-thread-at-a-time contract
+    documented on RiocClient.
+    """
+    def __init__(self, config: RiocConfig, size: int = 8):
+        if size < 1:
+            raise ValueError("size must be at least 1")
+        self._clients = queue.Queue()
+        for _ in range(size):
+            self._clients.put(RiocClient(config))
+        self._size = size
+
+    def borrow(self, timeout: Optional[float] = None) -> RiocClient:
+        """Take a client from the pool, blocking until one is available."""
+        return self._clients.get(timeout=timeout)
+
+    def release(self, client: RiocClient) -> None:
+        """Return a borrowed client to the pool."""
+        self._clients.put(client)
+
+    @contextmanager
+    def acquire(self, timeout: Optional[float] = None) -> Generator[RiocClient, None, None]:
+        """Context manager that borrows a client and returns it on exit."""
+        client = self.borrow(timeout=timeout)
+        try:
+            yield client
+        finally:
+            self.release(client)
+
+    def close(self) -> None:
+        """Close every pooled client."""
+        for _ in range(self._size):
+            self._clients.get().close()
+
+    def __enter__(self) -> "RiocClientPool":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
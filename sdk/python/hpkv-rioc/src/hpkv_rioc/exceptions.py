@@ -2,11 +2,28 @@
 RIOC SDK exceptions
 """
 
+# Native error code -> message, built once at import time instead of per raise
+_MESSAGES = {
+    -1: "Invalid parameters",
+    -2: "Out of memory",
+    -3: "I/O error",
+    -4: "Protocol error",
+    -5: "Device error",
+    -6: "Not found",
+    -7: "Resource busy",
+    -8: "Buffer overflow",
+}
+
 class RiocError(Exception):
     """Base exception for all RIOC errors."""
     def __init__(self, code: int, message: str):
         self.code = code
-        super().__init__(f"{message} (code: {code})")
+        self.message = message
+        super().__init__()
+
+    def __str__(self) -> str:
+        # Formatting is deferred until the error is actually inspected
+        return f"{self.message} (code: {self.code})"
 
 class RiocTimeoutError(RiocError):
     """Raised when an operation times out."""
@@ -18,16 +35,14 @@ class RiocConnectionError(RiocError):
     def __init__(self, message: str = "Connection error"):
         super().__init__(-3, message)
 
+# Codes with a dedicated exception class; everything else raises RiocError
+_CLASSES = {
+    -3: RiocConnectionError,
+}
+
 def create_rioc_error(code: int) -> RiocError:
-    """Create a RiocError from an error code."""
-    error_messages = {
-        -1: "Invalid parameters",
-        -2: "Out of memory",
-        -3: "I/O error",
-        -4: "Protocol error",
-        -5: "Device error",
-        -6: "Not found",
-        -7: "Resource busy",
-    }
-    message = error_messages.get(code, f"Unknown error ({code})")
-    return RiocError(code, message) 
\ No newline at end of file
+    """Create the appropriate exception for a native error code."""
+    cls = _CLASSES.get(code)
+    if cls is not None:
+        return cls(_MESSAGES[code])
+    return RiocError(code, _MESSAGES.get(code, "Unknown error"))
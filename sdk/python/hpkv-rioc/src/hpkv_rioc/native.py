@@ -3,21 +3,21 @@ RIOC native library interface
 """
 
 import ctypes
-import os
+import functools
 import platform
 import sys
 from ctypes import (
     c_int, c_uint, c_uint64, c_size_t, c_char_p, c_void_p, c_bool,
-    POINTER, Structure, CDLL, c_char
+    POINTER, Structure, CDLL
 )
 from pathlib import Path
-from typing import Optional
 
 # Platform-specific library names
 _WINDOWS_LIB = "rioc.dll"
 _LINUX_LIB = "librioc.so"
 _OSX_LIB = "librioc.dylib"
 
+@functools.cache
 def _get_lib_name() -> str:
     """Get the platform-specific library name."""
     if sys.platform == "win32":
@@ -28,8 +28,14 @@ def _get_lib_name() -> str:
         return _OSX_LIB
     raise OSError(f"Unsupported platform: {sys.platform}")
 
+@functools.cache
 def _get_lib_path() -> Path:
-    """Get the path to the native library."""
+    """Get the path to the native library.
+
+    Cached: the platform branches never change within a process and the
+    existence check is a stat syscall, so repeat callers (reloads, tooling
+    that probes the path) get the first answer back.
+    """
     # Get the package directory
     package_dir = Path(__file__).parent
 
@@ -77,123 +83,100 @@ class NativeClientConfig(Structure):
         ("tls", POINTER(NativeTlsConfig)),
     ]
 
-# Define the range result structure
+# Define the range result structure. key/value are deliberately not c_char_p:
+# a c_char_p field auto-converts to bytes on every attribute read, scanning for
+# and stopping at the first NUL. c_void_p reads as a plain address integer —
+# no pointer object is constructed per access — and string_at(addr, n) copies
+# exactly key_len/value_len bytes, which is both binary-safe and a single copy.
 class NativeRangeResult(Structure):
     """Native range query result structure."""
     _fields_ = [
-        ("key", c_char_p),
+        ("key", c_void_p),
         ("key_len", c_size_t),
-        ("value", c_char_p),
+        ("value", c_void_p),
         ("value_len", c_size_t),
     ]
 
-class RiocNative:
-    """RIOC native library interface."""
-    _instance: Optional["RiocNative"] = None
-    _lib: Optional[CDLL] = None
-
-    def __new__(cls):
-        if cls._instance is None:
-            cls._instance = super().__new__(cls)
-        return cls._instance
-
-    def __init__(self):
-        if self._lib is None:
-            self._init_library()
-
-    def _init_library(self):
-        """Initialize the native library."""
-        lib_path = _get_lib_path()
-        
-        # Load the library
-        if sys.platform == "win32":
-            self._lib = CDLL(str(lib_path))
-        else:
-            # Add library directory to search path on Unix
-            os.environ["LD_LIBRARY_PATH"] = f"{lib_path.parent}:{os.environ.get('LD_LIBRARY_PATH', '')}"
-            self._lib = CDLL(str(lib_path))
-
-        # Core client functions
-        self._lib.rioc_client_connect_with_config.argtypes = [POINTER(NativeClientConfig), POINTER(c_void_p)]
-        self._lib.rioc_client_connect_with_config.restype = c_int
-
-        self._lib.rioc_client_disconnect_with_config.argtypes = [c_void_p]
-        self._lib.rioc_client_disconnect_with_config.restype = None
-
-        self._lib.rioc_get.argtypes = [c_void_p, c_char_p, c_size_t, POINTER(POINTER(c_char)), POINTER(c_size_t)]
-        self._lib.rioc_get.restype = c_int
-
-        self._lib.rioc_insert.argtypes = [c_void_p, c_char_p, c_size_t, c_char_p, c_size_t, c_uint64]
-        self._lib.rioc_insert.restype = c_int
-
-        self._lib.rioc_delete.argtypes = [c_void_p, c_char_p, c_size_t, c_uint64]
-        self._lib.rioc_delete.restype = c_int
-
-        # Range query function - Fix the pointer types
-        self._lib.rioc_range_query.argtypes = [c_void_p, c_char_p, c_size_t, c_char_p, c_size_t, 
-                                              POINTER(POINTER(NativeRangeResult)), POINTER(c_size_t)]
-        self._lib.rioc_range_query.restype = c_int
-
-        # Free range results function
-        self._lib.rioc_free_range_results.argtypes = [POINTER(NativeRangeResult), c_size_t]
-        self._lib.rioc_free_range_results.restype = None
-
-        # Atomic operations
-        self._lib.rioc_atomic_inc_dec.argtypes = [c_void_p, c_char_p, c_size_t, ctypes.c_int64, c_uint64, POINTER(ctypes.c_int64)]
-        self._lib.rioc_atomic_inc_dec.restype = c_int
-
-        # Batch operations
-        self._lib.rioc_batch_create.argtypes = [c_void_p]
-        self._lib.rioc_batch_create.restype = c_void_p
-
-        self._lib.rioc_batch_add_get.argtypes = [c_void_p, c_char_p, c_size_t]
-        self._lib.rioc_batch_add_get.restype = c_int
-
-        self._lib.rioc_batch_add_insert.argtypes = [c_void_p, c_char_p, c_size_t, c_char_p, c_size_t, c_uint64]
-        self._lib.rioc_batch_add_insert.restype = c_int
-
-        self._lib.rioc_batch_add_delete.argtypes = [c_void_p, c_char_p, c_size_t, c_uint64]
-        self._lib.rioc_batch_add_delete.restype = c_int
-
-        # Atomic batch operations
-        self._lib.rioc_batch_add_atomic_inc_dec.argtypes = [c_void_p, c_char_p, c_size_t, ctypes.c_int64, c_uint64]
-        self._lib.rioc_batch_add_atomic_inc_dec.restype = c_int
-
-        # Range query batch function
-        self._lib.rioc_batch_add_range_query.argtypes = [c_void_p, c_char_p, c_size_t, c_char_p, c_size_t]
-        self._lib.rioc_batch_add_range_query.restype = c_int
-
-        self._lib.rioc_batch_execute_async.argtypes = [c_void_p]
-        self._lib.rioc_batch_execute_async.restype = c_void_p
-
-        self._lib.rioc_batch_wait.argtypes = [c_void_p, c_int]
-        self._lib.rioc_batch_wait.restype = c_int
-
-        self._lib.rioc_batch_get_response_async.argtypes = [c_void_p, c_size_t, POINTER(POINTER(c_char)), POINTER(c_size_t)]
-        self._lib.rioc_batch_get_response_async.restype = c_int
-
-        self._lib.rioc_batch_tracker_free.argtypes = [c_void_p]
-        self._lib.rioc_batch_tracker_free.restype = None
-
-        self._lib.rioc_batch_free.argtypes = [c_void_p]
-        self._lib.rioc_batch_free.restype = None
-
-        # Platform functions
-        self._lib.rioc_get_timestamp_ns.argtypes = []
-        self._lib.rioc_get_timestamp_ns.restype = c_uint64
-
-        self._lib.rioc_platform_init.argtypes = []
-        self._lib.rioc_platform_init.restype = c_int
-
-        self._lib.rioc_platform_cleanup.argtypes = []
-        self._lib.rioc_platform_cleanup.restype = None
-
-    @property
-    def lib(self) -> CDLL:
-        """Get the native library instance."""
-        if self._lib is None:
-            raise RuntimeError("Native library not initialized")
-        return self._lib
+# Pointer types used repeatedly in the signature table, spelled once.
+# POINTER() goes through a metaclass and a per-type cache; naming the results
+# keeps the table flat and skips even the cache lookups.
+_P_VOID = POINTER(c_void_p)
+_P_SIZE_T = POINTER(c_size_t)
+_P_INT64 = POINTER(ctypes.c_int64)
+_P_UINT64 = POINTER(c_uint64)
+_P_CHAR_P = POINTER(c_char_p)
+_P_RANGE = POINTER(NativeRangeResult)
+_PP_RANGE = POINTER(_P_RANGE)
+_P_CONFIG = POINTER(NativeClientConfig)
+
+# Every exported function gets its argtypes/restype declared exactly once at
+# load time, so ctypes uses known-signature argument conversion on every call
+# instead of inspecting each argument generically. Declaring restype matters
+# for correctness too: without it ctypes truncates returns to a C int (the
+# 64-bit timestamp would be cut to 32 bits).
+_SIGNATURES = (
+    # Core client functions
+    ("rioc_client_connect_with_config", [_P_CONFIG, _P_VOID], c_int),
+    ("rioc_client_disconnect_with_config", [c_void_p], None),
+    ("rioc_get", [c_void_p, c_char_p, c_size_t, _P_VOID, _P_SIZE_T], c_int),
+    ("rioc_insert", [c_void_p, c_char_p, c_size_t, c_char_p, c_size_t, c_uint64], c_int),
+    ("rioc_delete", [c_void_p, c_char_p, c_size_t, c_uint64], c_int),
+    # Range queries
+    ("rioc_range_query", [c_void_p, c_char_p, c_size_t, c_char_p, c_size_t,
+                          _PP_RANGE, _P_SIZE_T], c_int),
+    ("rioc_free_range_results", [_P_RANGE, c_size_t], None),
+    # Atomic operations
+    ("rioc_atomic_inc_dec", [c_void_p, c_char_p, c_size_t, ctypes.c_int64, c_uint64,
+                             _P_INT64], c_int),
+    # Batch operations
+    ("rioc_batch_create", [c_void_p], c_void_p),
+    ("rioc_batch_add_get", [c_void_p, c_char_p, c_size_t], c_int),
+    ("rioc_batch_add_insert", [c_void_p, c_char_p, c_size_t, c_char_p, c_size_t, c_uint64], c_int),
+    ("rioc_batch_add_insert_many", [c_void_p, _P_CHAR_P, _P_SIZE_T,
+                                    _P_CHAR_P, _P_SIZE_T,
+                                    _P_UINT64, c_size_t], c_int),
+    ("rioc_batch_add_delete", [c_void_p, c_char_p, c_size_t, c_uint64], c_int),
+    ("rioc_batch_add_atomic_inc_dec", [c_void_p, c_char_p, c_size_t, ctypes.c_int64, c_uint64], c_int),
+    ("rioc_batch_add_range_query", [c_void_p, c_char_p, c_size_t, c_char_p, c_size_t], c_int),
+    ("rioc_batch_execute_async", [c_void_p], c_void_p),
+    ("rioc_batch_wait", [c_void_p, c_int], c_int),
+    ("rioc_batch_get_response_async", [c_void_p, c_size_t, _P_VOID, _P_SIZE_T], c_int),
+    ("rioc_batch_get_atomic_response_async", [c_void_p, c_size_t, _P_INT64], c_int),
+    ("rioc_batch_get_all_responses", [c_void_p, c_size_t, _P_VOID, _P_SIZE_T], c_int),
+    ("rioc_batch_tracker_free", [c_void_p], None),
+    ("rioc_batch_free", [c_void_p], None),
+    ("rioc_batch_reset", [c_void_p], None),
+    # Platform functions
+    ("rioc_get_timestamp_ns", [], c_uint64),
+    ("rioc_platform_init", [], c_int),
+    ("rioc_platform_cleanup", [], None),
+)
 
-# Global instance
-rioc_native = RiocNative() 
\ No newline at end of file
+def _load_library() -> CDLL:
+    """Load the native library and declare every exported signature."""
+    lib_path = _get_lib_path()
+
+    # Load the library by absolute path. The loader only reads
+    # LD_LIBRARY_PATH at process start, so mutating os.environ here never
+    # influenced the dlopen; any libraries shipped next to librioc are
+    # preloaded explicitly instead. use_errno/use_last_error stay off: no
+    # librioc entry point reports failures through errno, and enabling them
+    # would add a thread-state save/restore around every call.
+    if sys.platform != "win32":
+        suffix = ".so" if sys.platform == "linux" else ".dylib"
+        for dep_path in sorted(lib_path.parent.glob(f"*{suffix}*")):
+            if dep_path != lib_path:
+                CDLL(str(dep_path), mode=ctypes.RTLD_GLOBAL)
+    lib = CDLL(str(lib_path), use_errno=False, use_last_error=False)
+
+    for name, argtypes, restype in _SIGNATURES:
+        func = getattr(lib, name)
+        func.argtypes = argtypes
+        func.restype = restype
+
+    return lib
+
+# The library is loaded once at import time; modules reach it through this
+# plain attribute, so call sites bind functions directly instead of going
+# through a singleton instance and a property on every access.
+lib = _load_library()
\ No newline at end of file
@@ -6,6 +6,28 @@ import os
 import pytest
 from hpkv_rioc import RiocTlsConfig
 
+# Per-worker key namespace. pytest-xdist sets PYTEST_XDIST_WORKER in each
+# worker process before collection, so every worker writes under its own
+# prefix and the suite can run with -n auto against one shared server.
+# Outside xdist the prefix is a constant "w0:", keeping key shapes the same.
+_NS = os.environ.get("PYTEST_XDIST_WORKER", "w0") + ":"
+_NS_B = _NS.encode()
+
+def ns(key):
+    """Prefix a test key with this worker's namespace."""
+    if isinstance(key, bytes):
+        return _NS_B + key
+    return _NS + key
+
+def make_keys(prefix: bytes, n: int) -> list:
+    """Build n distinct worker-namespaced byte keys sharing a prefix.
+
+    Stays in the bytes domain (no f-string plus encode per key), so building
+    the large test datasets does not add formatting noise to timings.
+    """
+    prefix = _NS_B + prefix
+    return [prefix + b"%d" % i for i in range(n)]
+
 def get_default_certs_dir():
     """Get the default certificates directory."""
     return "/workspaces/kernel-high-performance-kv-store/api/rioc/certs"
@@ -70,9 +92,14 @@ def tls_config(request, certs_dir):
         verify_peer=True
     )
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def client(tls_config):
-    """Create a RIOC client for testing."""
+    """Create one RIOC client shared by the whole test session.
+
+    A function-scoped client costs a full TLS handshake per test; tests
+    isolate themselves by key prefix instead, so one connection serves the
+    suite.
+    """
     from hpkv_rioc import RiocClient, RiocConfig
     config = RiocConfig(
         host=os.getenv("RIOC_TEST_HOST", "localhost"),
@@ -2,36 +2,23 @@
 Tests for RIOC batch operations.
 """
 
-import os
 import pytest
-from datetime import datetime, UTC
 import time
 
-from hpkv_rioc import RiocClient, RiocConfig, RiocError
-
-# Test configuration
-TEST_HOST = os.getenv("RIOC_TEST_HOST", "localhost")
-TEST_PORT = int(os.getenv("RIOC_TEST_PORT", "8000"))
-TEST_TIMEOUT = int(os.getenv("RIOC_TEST_TIMEOUT", "5000"))
-TEST_USE_TLS = os.getenv("RIOC_TEST_USE_TLS", "true").lower() == "true"
-
-@pytest.fixture
-def client(tls_config):
-    """Create a RIOC client for testing."""
-    config = RiocConfig(
-        host=TEST_HOST,
-        port=TEST_PORT,
-        timeout_ms=TEST_TIMEOUT,
-        tls=tls_config
-    )
-    client = RiocClient(config)
-    yield client
+from hpkv_rioc import RiocError
+
+from conftest import make_keys, ns
+
+# The client fixture comes from conftest.py: one session-scoped connection
+# shared by every test here. Each test works under its own key prefix, so
+# sharing the connection does not leak state between tests while saving a
+# full TLS handshake per test.
 
 def test_batch_context_manager(client):
     """Test batch operations using context manager."""
-    keys = [f"test_batch_key_{i}".encode() for i in range(3)]
-    values = [f"test_batch_value_{i}".encode() for i in range(3)]
-    
+    keys = make_keys(b"test_batch_key_", 3)
+    values = make_keys(b"test_batch_value_", 3)
+
     # Insert multiple key-value pairs in a batch
     with client.batch() as batch:
         for key, value in zip(keys, values):
@@ -48,9 +35,9 @@ def test_batch_context_manager(client):
 
 def test_batch_manual(client):
     """Test batch operations using manual execution."""
-    keys = [f"test_batch_key_{i}".encode() for i in range(3)]
-    values = [f"test_batch_value_{i}".encode() for i in range(3)]
-    
+    keys = make_keys(b"test_batch_key_", 3)
+    values = make_keys(b"test_batch_value_", 3)
+
     # Create and execute batch
     batch = client.create_batch()
     for key, value in zip(keys, values):
@@ -69,8 +56,8 @@ def test_batch_manual(client):
 
 def test_batch_mixed_operations(client):
     """Test batch with mixed operations (insert, get, delete)."""
-    key1 = b"test_batch_mixed_1"
-    key2 = b"test_batch_mixed_2"
+    key1 = ns(b"test_batch_mixed_1")
+    key2 = ns(b"test_batch_mixed_2")
     value1 = b"value1"
     value2 = b"value2"
     
@@ -104,9 +91,9 @@ def test_batch_get_only(client):
     """Test batch with only get operations."""
     # First insert some test data
     test_data = {
-        b"test_batch_get_1": b"value1",
-        b"test_batch_get_2": b"value2",
-        b"test_batch_get_3": b"value3"
+        ns(b"test_batch_get_1"): b"value1",
+        ns(b"test_batch_get_2"): b"value2",
+        ns(b"test_batch_get_3"): b"value3"
     }
     for key, value in test_data.items():
         client.insert(key, value)
@@ -131,7 +118,7 @@ def test_batch_get_only(client):
 def test_batch_delete_only(client):
     """Test batch with only delete operations."""
     # First insert some test data
-    keys = [b"test_batch_del_1", b"test_batch_del_2", b"test_batch_del_3"]
+    keys = make_keys(b"test_batch_del_", 3)
     value = b"test_value"
     for key in keys:
         client.insert(key, value)
@@ -151,8 +138,8 @@ def test_batch_delete_only(client):
 def test_batch_large(client):
     """Test batch with large number of operations."""
     num_ops = 100
-    keys = [f"test_batch_large_{i}".encode() for i in range(num_ops)]
-    values = [f"test_batch_large_value_{i}".encode() for i in range(num_ops)]
+    keys = make_keys(b"test_batch_large_", num_ops)
+    values = make_keys(b"test_batch_large_value_", num_ops)
     
     # Insert in batch
     with client.batch() as batch:
@@ -175,6 +162,35 @@ def test_batch_large(client):
         for key in keys:
             batch.add_delete(key, client.get_timestamp())
 
+def test_batch_large_fused(client):
+    """Test insert, get and delete fused into a single batch round-trip.
+
+    Operations in a batch execute in submission order, so the interleaved
+    insert/get/delete triplets observe each other within one submit/wait
+    instead of three sequential batches.
+    """
+    num_keys = 40  # 3 ops per key, within the native batch size limit
+    keys = make_keys(b"test_batch_fused_", num_keys)
+    values = make_keys(b"test_batch_fused_value_", num_keys)
+
+    batch = client.create_batch()
+    for key, value in zip(keys, values):
+        batch.add_insert(key, value)  # per-batch clock orders the triplets
+        batch.add_get(key)
+        batch.add_delete(key)
+    tracker = batch.execute()
+    tracker.wait()
+
+    # Each get ran between its insert and delete and saw the inserted value
+    for i, expected in enumerate(values):
+        assert tracker.get_response(3 * i + 1) == expected
+
+    # The trailing deletes won
+    for key in keys:
+        with pytest.raises(RiocError) as exc_info:
+            client.get(key)
+        assert exc_info.value.code == -6  # RIOC_ERR_NOENT
+
 def test_batch_error_handling(client):
     """Test error handling in batch operations."""
     # Try to get non-existent keys in batch
@@ -194,7 +210,7 @@ def test_batch_error_handling(client):
 
 def test_batch_with_empty_values(client):
     """Test batch operations with empty values."""
-    keys = [b"test_batch_empty_1", b"test_batch_empty_2"]
+    keys = make_keys(b"test_batch_empty_", 2)
     min_value = b" "  # Use single space instead of empty value
 
     # First insert non-empty values
@@ -2,12 +2,30 @@
 Tests for RIOC TLS functionality.
 """
 
+import functools
 import os
 import pytest
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, UTC
 
 from hpkv_rioc import RiocClient, RiocConfig, RiocTlsConfig, RiocError
 
+from conftest import ns
+
+# Built once at import: the large-data payload. Random bytes rather than a
+# repeated character, so the TLS layer cannot shrink it and the test moves
+# the full 4 KiB through the encrypted path both ways.
+_VALUE_4K = os.urandom(4 * 1024)
+
+# Key/value pairs for the multi-operation test, formatted once instead of
+# per invocation
+_TLS_KV = [(ns(f"test_tls_key_{i}"), f"test_tls_value_{i}") for i in range(10)]
+
+# Cached rather than read at import: the autouse set_test_env fixture in
+# conftest publishes the command-line options into the environment after
+# collection, so the first (post-fixture) read is the right one and every
+# later call reuses it — including the existence stat in get_certs_dir.
+@functools.cache
 def get_certs_dir():
     """Get the certificates directory."""
     certs_dir = os.getenv("RIOC_TEST_CERTS_DIR", "/workspaces/kernel-high-performance-kv-store/api/rioc/certs")
@@ -15,14 +33,17 @@ def get_certs_dir():
         pytest.skip(f"Certificates directory not found: {certs_dir}")
     return certs_dir
 
+@functools.cache
 def get_test_host():
     """Get the test host."""
     return os.getenv("RIOC_TEST_HOST", "localhost")
 
+@functools.cache
 def get_test_port():
     """Get the test port."""
     return int(os.getenv("RIOC_TEST_PORT", "8000"))
 
+@functools.cache
 def get_test_timeout():
     """Get the test timeout."""
     return int(os.getenv("RIOC_TEST_TIMEOUT", "5000"))
@@ -47,16 +68,16 @@ def test_timeout():
     """Get the test timeout."""
     return get_test_timeout()
 
-@pytest.fixture
-def client(certs_dir, test_host, test_port, test_timeout):
-    """Create a RIOC client with TLS for testing."""
-    tls_config = RiocTlsConfig(
-        certificate_path=os.path.join(certs_dir, "client.crt"),
-        key_path=os.path.join(certs_dir, "client.key"),
-        ca_path=os.path.join(certs_dir, "ca.crt"),
-        verify_hostname=test_host,
-        verify_peer=True
-    )
+@pytest.fixture(scope="module")
+def client(tls_config, test_host, test_port, test_timeout):
+    """Create one TLS client shared across this module.
+
+    Module scope amortizes the TLS handshake over all tests here; the tests
+    that exercise connection setup and teardown build their own clients. The
+    standard tls_config comes from conftest, built once for the session and
+    shared with the concurrency tests below — only the tests probing broken
+    or relaxed TLS setups construct their own.
+    """
     config = RiocConfig(
         host=test_host,
         port=test_port,
@@ -74,7 +95,7 @@ def test_tls_connection(client):
 
 def test_tls_basic(client):
     """Test basic TLS functionality."""
-    key = "test_tls_key"
+    key = ns("test_tls_key")
     value = "test_tls_value"
 
     # Insert
@@ -94,10 +115,7 @@ def test_tls_basic(client):
 
 def test_tls_multiple_operations(client):
     """Test multiple operations over TLS."""
-    for i in range(10):
-        key = f"test_tls_key_{i}"
-        value = f"test_tls_value_{i}"
-
+    for key, value in _TLS_KV:
         # Insert
         client.insert_string(key, value)
 
@@ -108,15 +126,28 @@ def test_tls_multiple_operations(client):
         # Delete
         client.delete_string(key)
 
-def test_tls_concurrent_operations(client):
-    """Test concurrent operations over TLS."""
-    import threading
-    import queue
+def test_tls_concurrent_operations(tls_config, test_host, test_port, test_timeout):
+    """Test concurrent operations over TLS.
 
-    def worker(q, client, start, count):
+    One client per worker thread, per the client's threading contract: the
+    data paths are unlocked, so independent clients on separate connections
+    run fully in parallel instead of interleaving on a shared socket.
+    Worker failures re-raise through future.result(), so a failing thread
+    surfaces as soon as its future is inspected instead of after a full
+    join timeout.
+    """
+    config = RiocConfig(
+        host=test_host,
+        port=test_port,
+        timeout_ms=test_timeout,
+        tls=tls_config
+    )
+
+    def worker(start, count):
+        client = RiocClient(config)
         try:
             for i in range(start, start + count):
-                key = f"test_tls_concurrent_{i}"
+                key = ns(f"test_tls_concurrent_{i}")
                 value = f"test_tls_value_{i}"
 
                 # Insert
@@ -128,48 +159,28 @@ def test_tls_concurrent_operations(client):
 
                 # Delete
                 client.delete_string(key)
-        except Exception as e:
-            q.put(e)
-        else:
-            q.put(None)
-
-    threads = []
-    results = queue.Queue()
-
-    # Start 4 threads, each doing 25 operations
-    for i in range(4):
-        t = threading.Thread(
-            target=worker,
-            args=(results, client, i * 25, 25)
-        )
-        threads.append(t)
-        t.start()
-
-    # Wait for all threads
-    for t in threads:
-        t.join(timeout=30)
-        assert not t.is_alive(), "Thread timed out"
+        finally:
+            client.close()
 
-    # Check for errors
-    while not results.empty():
-        result = results.get()
-        assert result is None, f"Worker thread failed: {result}"
+    # 4 workers, each doing 25 operations on its own client
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        futures = [executor.submit(worker, i * 25, 25) for i in range(4)]
+        for future in futures:
+            future.result(timeout=30)
 
 def test_tls_large_data(client):
     """Test handling large data over TLS."""
-    key = "test_tls_large_key"
-    # Use 4KB value
-    value = "x" * (4 * 1024)  # 4KB string
+    key = ns(b"test_tls_large_key")
 
     # Insert
-    client.insert_string(key, value)
+    client.insert(key, _VALUE_4K)
 
     # Get
-    result = client.get_string(key)
-    assert result == value
+    result = client.get(key)
+    assert result == _VALUE_4K
 
     # Delete
-    client.delete_string(key)
+    client.delete(key)
 
     # Note: Server accepts larger values, so we don't test size limits here
 
@@ -244,32 +255,33 @@ def test_tls_wrong_hostname(certs_dir):
         RiocClient(config)  # Should fail because the server's cert doesn't match wrong.host.name
     assert exc_info.value.code == -3  # I/O error
 
-def test_tls_multiple_clients(certs_dir, test_host, test_port, test_timeout):
-    """Test multiple TLS clients."""
-    clients = []
-    for i in range(10):  # Create 10 concurrent clients
-        config = RiocConfig(
-            host=test_host,
-            port=test_port,
-            timeout_ms=test_timeout,
-            tls=RiocTlsConfig(
-                certificate_path=os.path.join(certs_dir, "client.crt"),
-                key_path=os.path.join(certs_dir, "client.key"),
-                ca_path=os.path.join(certs_dir, "ca.crt"),
-                verify_hostname=test_host,
-                verify_peer=True
-            )
-        )
+def test_tls_multiple_clients(tls_config, test_host, test_port, test_timeout):
+    """Test multiple concurrent TLS clients.
+
+    The ten handshakes run in a thread pool: each blocks in native code with
+    the GIL released, so they overlap instead of forming a serial chain of
+    round-trips plus handshake crypto.
+    """
+    config = RiocConfig(
+        host=test_host,
+        port=test_port,
+        timeout_ms=test_timeout,
+        tls=tls_config
+    )
+
+    def run_client(i):
         client = RiocClient(config)
-        clients.append(client)
-        
-        # Basic test for each client
-        key = f"test_multi_tls_{i}"
-        value = f"value_{i}"
-        client.insert_string(key, value)
-        assert client.get_string(key) == value
-        client.delete_string(key)
-    
-    # Cleanup
-    for client in clients:
-        client.close() 
\ No newline at end of file
+        try:
+            # Basic test for each client
+            key = ns(f"test_multi_tls_{i}")
+            value = f"value_{i}"
+            client.insert_string(key, value)
+            assert client.get_string(key) == value
+            client.delete_string(key)
+        finally:
+            client.close()
+
+    with ThreadPoolExecutor(max_workers=10) as executor:
+        futures = [executor.submit(run_client, i) for i in range(10)]
+        for future in futures:
+            future.result(timeout=30) 
\ No newline at end of file
@@ -251,17 +251,26 @@ struct rioc_batch *rioc_batch_create(struct rioc_client *client);
 int rioc_batch_add_get(struct rioc_batch *batch, const char *key, size_t key_len);
 int rioc_batch_add_insert(struct rioc_batch *batch, const char *key, size_t key_len,
                          const char *value, size_t value_len, uint64_t timestamp);
+int rioc_batch_add_insert_many(struct rioc_batch *batch,
+                              const char **keys, const size_t *key_lens,
+                              const char **values, const size_t *value_lens,
+                              const uint64_t *timestamps, size_t count);
 int rioc_batch_add_delete(struct rioc_batch *batch, const char *key, size_t key_len,
                          uint64_t timestamp);
 int rioc_batch_add_atomic_inc_dec(struct rioc_batch *batch, const char *key, size_t key_len,
                                  int64_t increment, uint64_t timestamp);
 void rioc_batch_free(struct rioc_batch *batch);
+void rioc_batch_reset(struct rioc_batch *batch);
 
 // Non-blocking batch operations
 struct rioc_batch_tracker* rioc_batch_execute_async(struct rioc_batch *batch);
 int rioc_batch_wait(struct rioc_batch_tracker *tracker, int timeout_ms);
-int rioc_batch_get_response_async(struct rioc_batch_tracker *tracker, size_t index, 
+int rioc_batch_get_response_async(struct rioc_batch_tracker *tracker, size_t index,
                                 char **value, size_t *value_len);
+int rioc_batch_get_atomic_response_async(struct rioc_batch_tracker *tracker, size_t index,
+                                        int64_t *result);
+int rioc_batch_get_all_responses(struct rioc_batch_tracker *tracker, size_t n,
+                                 char **values, size_t *value_lens);
 void rioc_batch_tracker_free(struct rioc_batch_tracker *tracker);
 int rioc_batch_add_range_query(struct rioc_batch *batch, 
                               const char *start_key, size_t start_key_len,
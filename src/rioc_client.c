@@ -500,6 +500,34 @@ int rioc_batch_add_insert(struct rioc_batch *batch, const char *key, size_t key_
     return batch_add_op(batch, RIOC_CMD_INSERT, key, key_len, value, value_len, timestamp);
 }
 
+// Add a run of INSERT ops in one call. This exists for the language
+// bindings, where each add is a full FFI crossing: packing the keys and
+// values into arrays and crossing once amortizes the call overhead over
+// the whole run. Validated up front so a failure leaves the batch as it
+// was before the call.
+int rioc_batch_add_insert_many(struct rioc_batch *batch,
+                              const char **keys, const size_t *key_lens,
+                              const char **values, const size_t *value_lens,
+                              const uint64_t *timestamps, size_t count) {
+    if (!batch || !keys || !key_lens || !values || !value_lens || !timestamps ||
+        count > RIOC_MAX_BATCH_SIZE - batch->count) {
+        return RIOC_ERR_PARAM;
+    }
+
+    for (size_t i = 0; i < count; i++) {
+        if (!keys[i] || key_lens[i] > RIOC_MAX_KEY_SIZE ||
+            (values[i] && value_lens[i] > RIOC_MAX_VALUE_SIZE)) {
+            return RIOC_ERR_PARAM;
+        }
+    }
+
+    for (size_t i = 0; i < count; i++) {
+        batch_add_op(batch, RIOC_CMD_INSERT, keys[i], key_lens[i],
+                     values[i], value_lens[i], timestamps[i]);
+    }
+    return RIOC_SUCCESS;
+}
+
 int rioc_batch_add_delete(struct rioc_batch *batch, const char *key, size_t key_len,
                          uint64_t timestamp) {
     return batch_add_op(batch, RIOC_CMD_DELETE, key, key_len, NULL, 0, timestamp);
@@ -565,6 +593,20 @@ void rioc_batch_free(struct rioc_batch *batch) {
     }
 }
 
+// Reset batch for reuse, keeping the pre-allocated buffers
+// Any tracker from a previous execute must be freed first, since the
+// tracker walks the batch ops while reaping responses
+void rioc_batch_reset(struct rioc_batch *batch) {
+    if (!batch) {
+        return;
+    }
+    memset(batch->ops, 0, batch->count * sizeof(struct rioc_batch_op));
+    batch->count = 0;
+    batch->iov_count = 0;
+    batch->value_buffer_used = 0;
+    batch->batch_header.count = 0;
+}
+
 // Execute batch asynchronously
 struct rioc_batch_tracker* rioc_batch_execute_async(struct rioc_batch *batch) {
     if (!batch || batch->count == 0) {
@@ -969,7 +1011,57 @@ int rioc_batch_get_response_async(struct rioc_batch_tracker *tracker, size_t ind
     struct rioc_batch_op *op = &tracker->batch->ops[index];
     *value = (char *)op->value_ptr;
     *value_len = op->response.value_len;
-    
+
+    return op->response.status;
+}
+
+// Fetch the first n responses in one call instead of one call per index.
+// values[i]/value_lens[i] receive each op's payload; returns the first
+// non-zero per-op status so callers can detect a failed op in the batch
+int rioc_batch_get_all_responses(struct rioc_batch_tracker *tracker, size_t n,
+                                 char **values, size_t *value_lens) {
+    if (!tracker || !values || !value_lens || n > tracker->batch->count) {
+        return RIOC_ERR_PARAM;
+    }
+
+    size_t responses_received = atomic_load_explicit(&tracker->responses_received, memory_order_acquire);
+    if (n > responses_received) {
+        return RIOC_ERR_IO;  // Responses not yet available
+    }
+
+    int status = RIOC_SUCCESS;
+    for (size_t i = 0; i < n; i++) {
+        struct rioc_batch_op *op = &tracker->batch->ops[i];
+        values[i] = (char *)op->value_ptr;
+        value_lens[i] = op->response.value_len;
+        if (status == RIOC_SUCCESS && op->response.status != RIOC_SUCCESS) {
+            status = op->response.status;
+        }
+    }
+
+    return status;
+}
+
+// Fetch an ATOMIC_INC_DEC result directly into an int64, skipping the
+// pointer/length out-params for callers that only want the scalar
+int rioc_batch_get_atomic_response_async(struct rioc_batch_tracker *tracker, size_t index,
+                                        int64_t *result) {
+    if (!tracker || !result || index >= tracker->batch->count) {
+        return RIOC_ERR_PARAM;
+    }
+
+    size_t responses_received = atomic_load_explicit(&tracker->responses_received, memory_order_acquire);
+    if (index >= responses_received) {
+        return RIOC_ERR_IO;  // Response not yet available
+    }
+
+    struct rioc_batch_op *op = &tracker->batch->ops[index];
+    if (!op->value_ptr || op->response.value_len < sizeof(int64_t)) {
+        *result = 0;
+    } else {
+        memcpy(result, op->value_ptr, sizeof(int64_t));
+    }
+
     return op->response.status;
 }
 